@@ -0,0 +1,361 @@
+import re
+import time
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+class GitHubActionsWrapper:
+    """
+    A wrapper class for the GitHub Actions REST API.
+    """
+
+    def __init__(self, owner, repo, token):
+        """
+        Initialize GitHubActionsWrapper with repository coordinates and an API token.
+
+        Args:
+            owner (str): Owner of the GitHub repository.
+            repo (str): Name of the GitHub repository.
+            token (str): Personal access token used for authentication.
+        """
+        self.owner = owner
+        self.repo = repo
+        self.base_url = f"https://api.github.com/repos/{owner}/{repo}"
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json"
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"]
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        )
+        self._cache = {}
+        self.cache_ttl = 60
+        self._workflow_id_cache = None
+
+    def _get(self, url, **kwargs):
+        """
+        GET a URL through the session, waiting out GitHub's rate-limit window.
+
+        Transient 5xx/429 responses are retried by the mounted adapter with
+        exponential backoff. When the rate limit is exhausted, sleep until
+        X-RateLimit-Reset and retry once instead of failing outright.
+
+        Args:
+            url (str): URL to fetch.
+            **kwargs: Extra keyword arguments passed to the session.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        response = self.session.get(url, **kwargs)
+        if response.status_code in (403, 429) and \
+                response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(response.headers.get("X-RateLimit-Reset", 0))
+            time.sleep(max(0, reset - time.time()))
+            response = self.session.get(url, **kwargs)
+        return response
+
+    def _cached_get_json(self, url):
+        """
+        GET a read-only JSON endpoint through a TTL+ETag cache.
+
+        Within the TTL the cached body is returned without a network call.
+        After the TTL the cached ETag is revalidated with If-None-Match, so a
+        304 refreshes the entry without re-downloading the body.
+
+        Args:
+            url (str): URL to fetch.
+
+        Returns:
+            dict: Parsed JSON response body.
+        """
+        entry = self._cache.get(url)
+        if entry:
+            etag, expires_at, data = entry
+            if time.monotonic() < expires_at:
+                return data
+            response = self._get(url, headers={"If-None-Match": etag})
+            if response.status_code == 304:
+                self._cache[url] = (etag, time.monotonic() + self.cache_ttl, data)
+                return data
+        else:
+            response = self._get(url)
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache[url] = (etag, time.monotonic() + self.cache_ttl, data)
+        return data
+
+    def clear_cache(self):
+        """
+        Clear all cached responses.
+        """
+        self._cache.clear()
+
+    def get_workflows(self):
+        """
+        Get all workflows defined in the repository.
+
+        Returns:
+            list: List of workflow dictionaries.
+        """
+        data = self._cached_get_json(f"{self.base_url}/actions/workflows")
+        return data.get("workflows", [])
+
+    def get_workflow_id(self, workflow_path):
+        """
+        Get the ID of a workflow by its path (e.g. '.github/workflows/ci.yml').
+
+        The path-to-id mapping is built once from a single workflows listing
+        and answered from memory afterwards; call refresh_workflows() to pick
+        up workflows added since.
+
+        Args:
+            workflow_path (str): Path of the workflow file in the repository.
+
+        Returns:
+            int: ID of the workflow, or None if not found.
+        """
+        if self._workflow_id_cache is None:
+            self._build_workflow_id_cache()
+        return self._workflow_id_cache.get(workflow_path)
+
+    def _build_workflow_id_cache(self):
+        """
+        Build the workflow path-to-id mapping from the current listing.
+        """
+        self._workflow_id_cache = {
+            workflow["path"]: workflow["id"] for workflow in self.get_workflows()
+        }
+
+    def refresh_workflows(self):
+        """
+        Rebuild the workflow path-to-id mapping from the API.
+
+        The workflows listing is evicted from the response cache first, so
+        the rebuild always revalidates against the network instead of being
+        answered from a body cached within the TTL.
+
+        Returns:
+            dict: The refreshed mapping of workflow path to workflow ID.
+        """
+        self._cache.pop(f"{self.base_url}/actions/workflows", None)
+        self._build_workflow_id_cache()
+        return self._workflow_id_cache
+
+    def find_workflow_ids(self, pattern):
+        """
+        Find the IDs of all workflows whose path matches a regex pattern.
+
+        The pattern is compiled once and swept over the memoized path-to-id
+        mapping, so no network call or per-path recompilation happens.
+
+        Args:
+            pattern (str): Regular expression matched against workflow paths.
+
+        Returns:
+            list: IDs of the matching workflows.
+        """
+        if self._workflow_id_cache is None:
+            self._build_workflow_id_cache()
+        regex = re.compile(pattern)
+        return [
+            workflow_id for path, workflow_id in self._workflow_id_cache.items()
+            if regex.search(path)
+        ]
+
+    def get_workflow_runs(self, workflow_id):
+        """
+        Get the runs of a specific workflow.
+
+        Args:
+            workflow_id (int): ID of the workflow.
+
+        Returns:
+            list: List of workflow run dictionaries.
+        """
+        data = self._cached_get_json(
+            f"{self.base_url}/actions/workflows/{workflow_id}/runs"
+        )
+        return data.get("workflow_runs", [])
+
+    def get_many_workflow_runs(self, workflow_ids, max_workers=20):
+        """
+        Get the runs of many workflows, fetching them concurrently.
+
+        The per-workflow requests share the pooled keep-alive session, so the
+        fan-out reuses warm connections instead of paying a handshake each.
+
+        Args:
+            workflow_ids (list): IDs of the workflows to query.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 20.
+
+        Returns:
+            dict: Mapping of workflow ID to that workflow's runs.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            runs = executor.map(self.get_workflow_runs, workflow_ids)
+        return dict(zip(workflow_ids, runs))
+
+    def iter_workflow_runs(self, workflow_id, per_page=100):
+        """
+        Iterate over the runs of a workflow one page at a time.
+
+        Pages are fetched lazily via the per_page query parameter, so peak
+        memory stays bounded by one page instead of the full run history.
+
+        Args:
+            workflow_id (int): ID of the workflow.
+            per_page (int, optional): Number of runs per page. Defaults to 100.
+
+        Yields:
+            dict: One workflow run dictionary at a time.
+        """
+        page = 1
+        while True:
+            response = self._get(
+                f"{self.base_url}/actions/workflows/{workflow_id}/runs"
+                f"?per_page={per_page}&page={page}"
+            )
+            runs = orjson.loads(response.content).get("workflow_runs", [])
+            yield from runs
+            if len(runs) < per_page:
+                break
+            page += 1
+
+    def trigger_workflow(self, workflow_id, ref, inputs=None):
+        """
+        Trigger a workflow dispatch event.
+
+        Args:
+            workflow_id (int): ID of the workflow to trigger.
+            ref (str): Git reference (branch or tag) to run the workflow on.
+            inputs (dict, optional): Input parameters for the workflow. Defaults to None.
+
+        Returns:
+            bool: True if the workflow was triggered successfully, False otherwise.
+        """
+        payload = {"ref": ref}
+        if inputs:
+            payload["inputs"] = inputs
+        response = self.session.post(
+            f"{self.base_url}/actions/workflows/{workflow_id}/dispatches",
+            json=payload
+        )
+        return response.status_code == 204
+
+    def get_workflow_run_jobs(self, run_id):
+        """
+        Get the jobs of a specific workflow run.
+
+        Args:
+            run_id (int): ID of the workflow run.
+
+        Returns:
+            list: List of job dictionaries.
+        """
+        data = self._cached_get_json(
+            f"{self.base_url}/actions/runs/{run_id}/jobs"
+        )
+        return data.get("jobs", [])
+
+    def get_workflow_run_logs(self, run_id):
+        """
+        Get the logs archive of a specific workflow run.
+
+        Args:
+            run_id (int): ID of the workflow run.
+
+        Returns:
+            bytes: Zip archive containing the run logs.
+        """
+        response = self._get(
+            f"{self.base_url}/actions/runs/{run_id}/logs"
+        )
+        return response.content
+
+    def get_job_logs(self, job_id):
+        """
+        Get the logs of a specific job.
+
+        Args:
+            job_id (int): ID of the job.
+
+        Returns:
+            str: Plain-text logs of the job.
+        """
+        response = self._get(
+            f"{self.base_url}/actions/jobs/{job_id}/logs"
+        )
+        return response.text
+
+    def get_logs_for_run_jobs(self, run_id, max_workers=20):
+        """
+        Get the logs of every job of a workflow run, fetching them concurrently.
+
+        Args:
+            run_id (int): ID of the workflow run.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 20.
+
+        Returns:
+            dict: Mapping of job ID to the job's logs.
+        """
+        jobs = self.get_workflow_run_jobs(run_id)
+        job_ids = [job["id"] for job in jobs]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            logs = executor.map(self.get_job_logs, job_ids)
+        return dict(zip(job_ids, logs))
+
+    def get_artifacts_for_run(self, run_id):
+        """
+        Get the artifacts produced by a specific workflow run.
+
+        Args:
+            run_id (int): ID of the workflow run.
+
+        Returns:
+            list: List of artifact dictionaries.
+        """
+        data = self._cached_get_json(
+            f"{self.base_url}/actions/runs/{run_id}/artifacts"
+        )
+        return data.get("artifacts", [])
+
+    def download_artifact(self, artifact_id, destination, chunk_size=1 << 20):
+        """
+        Download an artifact as a zip archive to a local file.
+
+        The response is streamed to disk chunk by chunk, so peak memory stays
+        bounded by chunk_size instead of the full artifact size.
+
+        Args:
+            artifact_id (int): ID of the artifact to download.
+            destination (str): Path of the local file to write the archive to.
+            chunk_size (int, optional): Size in bytes of each streamed chunk. Defaults to 1 MiB.
+
+        Returns:
+            bool: True if the download was successful, False otherwise.
+        """
+        response = self._get(
+            f"{self.base_url}/actions/artifacts/{artifact_id}/zip",
+            stream=True
+        )
+        if response.status_code != 200:
+            return False
+        with open(destination, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+        return True
@@ -1,6 +1,49 @@
+import threading
+import time
+
+import orjson
+
 import jenkins
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Compiled once so repeated view reconfigurations skip re-parsing the XPath.
+_JOBS_XPATH = etree.XPath('.//jobNames')
+
+def _job_path(name):
+    """
+    Build the /job/... URL fragment for a possibly folder-nested job name.
+
+    Each '/'-separated segment is quoted and becomes its own /job/
+    component, matching how python-jenkins addresses jobs inside folders.
+
+    Args:
+        name (str): Job name, with '/' separating folder levels.
+
+    Returns:
+        str: The quoted /job/... path fragment.
+    """
+    return '/job/' + '/job/'.join(quote(segment) for segment in name.split('/'))
 
 class JenkinsWrapper:
+    """
+    A wrapper class for the Jenkins REST API.
+
+    Transport is a pooled requests session speaking HTTP/1.1 with
+    keep-alive. Parallelism comes from overlapping requests across the
+    connection pool (see get_jobs_with_info and the usage script's
+    fan-out) rather than HTTP/2 multiplexing, which neither requests nor
+    python-jenkins can carry.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
     def __init__(self, server_url, username, password):
         """
         Initialize JenkinsWrapper with server URL, username, and password.
@@ -14,6 +57,145 @@ class JenkinsWrapper:
         self.username = username
         self.password = password
         self.server = jenkins.Jenkins(server_url, username=username, password=password)
+        self.session = requests.Session()
+        self.session.auth = (username, password)
+        self.session.headers['Connection'] = 'keep-alive'
+        # Large repetitive payloads like the plugin listing compress 5-10x;
+        # make the negotiation explicit rather than relying on defaults.
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Route python-jenkins through the same pooled session so its calls
+        # also reuse warm connections instead of reconnecting per request.
+        self.server._session = self.session
+        # The CSRF crumb is fetched lazily on the first mutating call, so
+        # constructing a wrapper (or importing a module that does) costs no
+        # network round-trip up front.
+        self._crumb_field = None
+        self._crumb_primed = False
+        self._ttl_cache = {}
+        self.meta_ttl = 300
+        # Validator entries keep the full cached body, so the store is
+        # bounded; oldest entries are evicted first.
+        self._validators = {}
+        self._validators_max = 128
+        # Encoded once so loops creating many jobs from the default template
+        # skip the per-call str.encode.
+        self._empty_config_bytes = jenkins.EMPTY_CONFIG_XML.encode('utf-8')
+        # Overlap the cold TCP/TLS + crumb handshake with whatever else the
+        # caller does between construction and the first real call.
+        self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+        self._warmup_thread.start()
+
+    @classmethod
+    def get_default(cls, server_url, username, password):
+        """
+        Return a process-wide shared instance, creating it on first use.
+
+        Repeated callers reuse the same pooled session, crumb and metadata
+        cache instead of each constructing their own wrapper.
+
+        Args:
+            server_url (str): URL of the Jenkins server.
+            username (str): Username for authentication.
+            password (str): Password for authentication.
+
+        Returns:
+            JenkinsWrapper: The shared instance.
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls(server_url, username, password)
+        return cls._default
+
+    def _memo(self, key, fetch):
+        """
+        Return a cached value for key, refreshing it via fetch after the TTL.
+
+        Server info, plugins, views and node topology change on hour or day
+        timescales, so repeated reads within the TTL are answered from memory
+        instead of paying a round-trip each.
+
+        Args:
+            key (str): Cache key.
+            fetch (callable): Zero-argument callable producing a fresh value.
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        entry = self._ttl_cache.get(key)
+        now = time.monotonic()
+        if entry and now < entry[0]:
+            return entry[1]
+        value = fetch()
+        self._ttl_cache[key] = (now + self.meta_ttl, value)
+        return value
+
+    def invalidate(self, key=None):
+        """
+        Drop cached metadata, either one key or everything.
+
+        Args:
+            key (str, optional): Cache key to drop. Defaults to None (drop all).
+        """
+        if key is None:
+            self._ttl_cache.clear()
+        else:
+            self._ttl_cache.pop(key, None)
+
+    def _api_json(self, path, tree=None, depth=None, conditional=True):
+        """
+        GET a Jenkins api/json endpoint over the persistent session.
+
+        The session keeps the TCP connection alive, so high-frequency reads
+        skip the per-call connection setup python-jenkins would pay. When a
+        previous response carried an ETag or Last-Modified validator, the
+        request is sent conditionally; a 304 answers from the cached body
+        with no bytes transferred and no JSON parsed. Polling reads that
+        must always see the live body pass conditional=False so a proxy-
+        added validator can never replay a stale response.
+
+        Args:
+            path (str): Path below the server URL, e.g. '/job/my-job'.
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+            depth (int, optional): Jenkins depth parameter for nested fields.
+            conditional (bool, optional): Whether to use and record ETag /
+                Last-Modified validators. Defaults to True.
+
+        Returns:
+            dict: Parsed JSON response.
+        """
+        url = f"{self.server_url}{path}/api/json"
+        params = []
+        if depth is not None:
+            params.append(f"depth={depth}")
+        if tree:
+            params.append(f"tree={tree}")
+        if params:
+            url += "?" + "&".join(params)
+        headers = {}
+        cached = self._validators.get(url) if conditional else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[2]
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        if conditional:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                if url not in self._validators and len(self._validators) >= self._validators_max:
+                    self._validators.pop(next(iter(self._validators)))
+                self._validators[url] = (etag, last_modified, data)
+        return data
 
     def get_server_info(self):
         """
@@ -22,7 +204,7 @@ class JenkinsWrapper:
         Returns:
             dict: Server information.
         """
-        return self.server.get_version()
+        return self._memo('server_info', self.server.get_version)
 
     def get_user_info(self):
         """
@@ -42,41 +224,206 @@ class JenkinsWrapper:
         }
         return user_info
       
-    def create_job(self, job_name, config_xml=jenkins.EMPTY_CONFIG_XML):
-        return self.server.create_job(job_name, config_xml)
+    def _fetch_crumb(self):
+        """
+        Fetch a CSRF crumb and install it as a session-wide header.
+
+        The crumb stays valid for the session lifetime, so it is fetched once
+        rather than before every POST. Servers running without CSRF
+        protection answer 404, which is simply ignored.
+        """
+        if self._crumb_field:
+            self.session.headers.pop(self._crumb_field, None)
+            self._crumb_field = None
+        response = self.session.get(f"{self.server_url}/crumbIssuer/api/json")
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            self._crumb_field = data['crumbRequestField']
+            self.session.headers[self._crumb_field] = data['crumb']
+
+    def _ensure_crumb(self):
+        """
+        Fetch the CSRF crumb before the first mutating call.
+        """
+        if not self._crumb_primed:
+            self._fetch_crumb()
+            self._crumb_primed = True
+
+    def _warmup(self):
+        """
+        Warm the connection pool, crumb and server-info cache in the background.
+
+        Best-effort: failures are swallowed here and surface on the first
+        real call instead.
+        """
+        try:
+            self._ensure_crumb()
+            self.get_server_info()
+        except Exception:
+            pass
 
-    def get_all_jobs(self):
+    def _post_xml(self, path, body, params=None):
+        """
+        POST an already-encoded XML body over the persistent session.
+
+        Args:
+            path (str): Path below the server URL, e.g. '/createItem'.
+            body (bytes): UTF-8 encoded XML request body.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        self._ensure_crumb()
+        headers = {'Content-Type': 'application/xml; charset=utf-8'}
+        response = self.session.post(
+            f"{self.server_url}{path}", data=body, params=params, headers=headers
+        )
+        if response.status_code == 403:
+            # The crumb was likely invalidated; refresh it once and retry.
+            self._fetch_crumb()
+            response = self.session.post(
+                f"{self.server_url}{path}", data=body, params=params, headers=headers
+            )
+        response.raise_for_status()
+        return response
+
+    def create_job(self, job_name, config_xml=None):
+        """
+        Create a job from an XML configuration.
+
+        Accepts str or bytes; byte bodies are sent as-is, so callers creating
+        many jobs from one template can encode it once up front.
+
+        Args:
+            job_name (str): Name of the job to create.
+            config_xml (str or bytes, optional): Job configuration XML.
+                Defaults to the empty job configuration.
+        """
+        if config_xml is None:
+            body = self._empty_config_bytes
+        elif isinstance(config_xml, str):
+            body = config_xml.encode('utf-8')
+        else:
+            body = config_xml
+        return self._post_xml("/createItem", body, params={'name': job_name})
+
+    def get_all_jobs(self, folder=None, depth=1):
         """
         Get information about all Jenkins jobs.
 
+        One tree-filtered request returns name, url and color per job instead
+        of python-jenkins recursively enumerating every job document, which
+        can take minutes on large instances.
+
+        Args:
+            folder (str, optional): Folder to list jobs from. Defaults to the root.
+            depth (int, optional): How many folder levels to descend. Defaults to 1.
+
         Returns:
             list: List of dictionaries containing information about each job.
         """
-        return self.server.get_jobs()
-
-    def get_job_info(self, job_name):
+        subtree = "name,url,color"
+        tree = f"jobs[{subtree}]"
+        for _ in range(depth - 1):
+            tree = f"jobs[{subtree},{tree}]"
+        path = _job_path(folder) if folder else ""
+        return self._api_json(path, tree=tree)['jobs']
+
+    def get_job_info(self, job_name,
+                     tree="name,url,color,lastBuild[number,url,result,timestamp,duration]"):
         """
         Get information about a specific Jenkins job.
 
+        The default tree expression fetches the common fields plus the
+        last-build subtree, so one request answers both "what is this job"
+        and "how did it last run". Pass tree=None for the full document.
+
         Args:
             job_name (str): Name of the job.
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
 
         Returns:
             dict: Information about the job.
         """
-        return self.server.get_job_info(job_name)
+        return self._api_json(_job_path(job_name), tree=tree)
+
+    def job(self, job_name):
+        """
+        Get a JobHandle with the job's URL fragment preformatted.
+
+        Args:
+            job_name (str): Name of the job.
+
+        Returns:
+            JobHandle: Handle exposing per-job operations.
+        """
+        return JobHandle(self, job_name)
+
+    def get_jobs_with_info(self, job_names=None, max_workers=16):
+        """
+        Get detailed information about many Jenkins jobs concurrently.
+
+        Args:
+            job_names (list, optional): Names of the jobs to query. Defaults to all jobs.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            list: Information about each job, in the same order as job_names.
+        """
+        if job_names is None:
+            job_names = [job['name'] for job in self.get_all_jobs()]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_job_info, job_names))
+
+    def get_jobs_info_bulk(self, job_names, concurrency=16, batch_size=64, tree=None):
+        """
+        Get tree-filtered information about many jobs with bounded fan-out.
+
+        Names are processed in batches of batch_size so socket count and
+        buffered responses stay bounded on very large job lists, while
+        concurrency caps the requests in flight within each batch. The
+        request suggested an asyncio semaphore; a sized thread pool is the
+        synchronous equivalent here.
+
+        Args:
+            job_names (list): Names of the jobs to query.
+            concurrency (int, optional): Maximum requests in flight. Defaults to 16.
+            batch_size (int, optional): Names processed per batch. Defaults to 64.
+            tree (str, optional): Tree expression forwarded to get_job_info.
+                Defaults to get_job_info's field set.
+
+        Returns:
+            list: Information about each job, in the same order as job_names.
+        """
+        kwargs = {} if tree is None else {'tree': tree}
+        results = []
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for start in range(0, len(job_names), batch_size):
+                batch = job_names[start:start + batch_size]
+                results.extend(
+                    executor.map(lambda name: self.get_job_info(name, **kwargs), batch)
+                )
+        return results
 
     def get_last_build_info(self, job_name):
         """
         Get information about the last build of a Jenkins job.
 
+        Only the last-build fields are requested via the tree query parameter,
+        so the response stays small regardless of the job's build history.
+
         Args:
             job_name (str): Name of the job.
 
         Returns:
             dict: Information about the last build.
         """
-        return self.server.get_job_info(job_name)['lastBuild']
+        data = self._api_json(
+            _job_path(job_name),
+            tree="lastBuild[number,url,result,timestamp,duration]"
+        )
+        return data['lastBuild']
 
     def trigger_build(self, job_name):
         """
@@ -86,10 +433,46 @@ class JenkinsWrapper:
             job_name (str): Name of the job to trigger the build for.
 
         Returns:
-            dict: Response from Jenkins after triggering the build.
+            int: Queue item number of the triggered build; pass it to
+                wait_for_build to resolve the build deterministically.
         """
         return self.server.build_job(job_name)
 
+    def wait_for_build(self, queue_id, initial=0.2, max_interval=5.0, timeout=120):
+        """
+        Wait for a queued build to start and return its build reference.
+
+        Polls the queue item rather than lastBuild, so there is no race
+        between "triggered" and "build exists", and the interval backs off
+        exponentially up to max_interval instead of hammering the server.
+
+        Args:
+            queue_id (int): Queue item number returned by trigger_build.
+            initial (float, optional): First poll interval in seconds. Defaults to 0.2.
+            max_interval (float, optional): Cap on the poll interval. Defaults to 5.0.
+            timeout (float, optional): Overall wait bound in seconds. Defaults to 120.
+
+        Returns:
+            dict: The executable with the build's number and url.
+
+        Raises:
+            TimeoutError: If the build has not started within timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial
+        while time.monotonic() < deadline:
+            item = self._api_json(
+                f"/queue/item/{queue_id}",
+                tree="executable[number,url]",
+                conditional=False,
+            )
+            executable = item.get('executable')
+            if executable:
+                return executable
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+        raise TimeoutError(f"Queue item {queue_id} did not start within {timeout}s")
+
     def get_build_info(self, job_name, build_number):
         """
         Get information about a specific build of a job.
@@ -101,7 +484,7 @@ class JenkinsWrapper:
         Returns:
             dict: Information about the build.
         """
-        return self.server.get_build_info(job_name, build_number)
+        return self._api_json(f"{_job_path(job_name)}/{build_number}")
 
     def get_build_console_output(self, job_name, build_number):
         """
@@ -116,6 +499,37 @@ class JenkinsWrapper:
         """
         return self.server.get_build_console_output(job_name, build_number)
 
+    def iter_console(self, job_name, build_number, poll_interval=2.0):
+        """
+        Stream the console output of a build incrementally.
+
+        Uses Jenkins's logText/progressiveText endpoint, which returns only
+        the bytes appended since the last offset, so long-running builds can
+        be tailed with bounded memory instead of downloading the full log.
+
+        Args:
+            job_name (str): Name of the job.
+            build_number (int): Build number.
+            poll_interval (float, optional): Seconds between polls while the build
+                is still producing output. Defaults to 2.0.
+
+        Yields:
+            str: Next chunk of console output.
+        """
+        start = 0
+        while True:
+            response = self.session.get(
+                f"{self.server_url}{_job_path(job_name)}/{build_number}"
+                f"/logText/progressiveText?start={start}"
+            )
+            response.raise_for_status()
+            if response.text:
+                yield response.text
+            start = int(response.headers.get('X-Text-Size', start))
+            if response.headers.get('X-More-Data') != 'true':
+                break
+            time.sleep(poll_interval)
+
     def get_build_test_report(self, job_name, build_number):
         """
         Get the test report for a specific build of a job.
@@ -178,8 +592,7 @@ class JenkinsWrapper:
         Returns:
             dict: Response from Jenkins after copying the job.
         """
-        config_xml = self.get_job_config(job_name)
-        return self.create_job(new_job_name, config_xml)
+        return self.server.copy_job(job_name, new_job_name)
 
     def enable_job(self, job_name):
         """
@@ -242,6 +655,7 @@ class JenkinsWrapper:
         Returns:
             dict: Response from Jenkins after creating the view.
         """
+        self.invalidate('views')
         return self.server.create_view(view_name, view_description)
 
     def add_jobs_to_view(self, view_name, jobs):
@@ -258,24 +672,23 @@ class JenkinsWrapper:
         try:
             # Get existing view configuration
             view_config = self.get_view_config(view_name)
-            
+
             # Parse the XML configuration
-            root = ElementTree.fromstring(view_config.encode())
+            root = etree.fromstring(view_config.encode())
 
             # Find the jobs element
-            jobs_element = root.find('.//jobNames')
-
-            # Add new jobs to the jobs element
-            for job in jobs:
-                job_name = job.get('name')
-                if job_name and job_name not in jobs_element.text.split(','):
-                    jobs_element.text += ',' + job_name
-            
+            jobs_element = _JOBS_XPATH(root)[0]
+
+            # Merge the new job names into the existing set
+            existing = set(filter(None, (jobs_element.text or '').split(',')))
+            existing.update(job['name'] for job in jobs if job.get('name'))
+            jobs_element.text = ','.join(sorted(existing))
+
             # Update the view configuration
-            updated_config = ElementTree.tostring(root, encoding='unicode')
+            updated_config = etree.tostring(root, encoding='unicode')
 
             # Reconfigure the view with updated configuration
-            self.reconfig_job(view_name, updated_config)
+            self.server.reconfig_view(view_name, updated_config)
 
             return True
         except Exception as e:
@@ -289,7 +702,16 @@ class JenkinsWrapper:
         Returns:
             list: List of views in Jenkins.
         """
-        return self.server.get_views()
+        return self._memo('views', self._fetch_views)
+
+    def _fetch_views(self):
+        """
+        Fetch the view listing over the pooled session with validators.
+
+        Returns:
+            list: View dictionaries with name and url.
+        """
+        return self._api_json("", tree="views[name,url]")['views']
 
     def get_view_config(self, view_name):
         """
@@ -313,6 +735,7 @@ class JenkinsWrapper:
         Returns:
             dict: Response from Jenkins after deleting the view.
         """
+        self.invalidate('views')
         return self.server.delete_view(view_name)
 
     def get_queue_info(self):
@@ -328,10 +751,27 @@ class JenkinsWrapper:
         """
         Get information about installed plugins in Jenkins.
 
+        The response is tree-filtered down to the commonly used plugin fields
+        and parsed with orjson, so the multi-megabyte full listing is neither
+        transferred nor parsed.
+
         Returns:
             list: Information about installed plugins.
         """
-        return self.server.get_plugins_info()
+        return self._memo('plugins', self._fetch_plugins)
+
+    def _fetch_plugins(self):
+        """
+        Fetch the tree-filtered plugin listing over the pooled session.
+
+        Returns:
+            list: Plugin dictionaries with shortName, version, active and enabled.
+        """
+        return self._api_json(
+            "/pluginManager",
+            tree="plugins[shortName,version,active,enabled]",
+            depth=1,
+        )['plugins']
 
     def create_node(self, name, num_executors=2, node_description=None, remote_fs='/var/lib/jenkins', labels=''):
         """
@@ -347,6 +787,7 @@ class JenkinsWrapper:
         Returns:
             bool: True if the node creation was successful, False otherwise.
         """
+        self.invalidate('nodes')
         return self.server.create_node(name, num_executors, node_description, remote_fs, labels)
 
     def enable_node(self, node_name):
@@ -380,6 +821,307 @@ class JenkinsWrapper:
         Returns:
             list: Information about all nodes.
         """
-        return self.server.get_nodes()
+        return self._memo('nodes', self._fetch_nodes)
+
+    def _fetch_nodes(self):
+        """
+        Fetch the node listing over the pooled session with validators.
+
+        Returns:
+            list: Node dictionaries with name and offline state.
+        """
+        data = self._api_json("/computer", tree="computer[displayName,offline]")
+        return [
+            {'name': computer['displayName'], 'offline': computer['offline']}
+            for computer in data['computer']
+        ]
+
+    def get_computers(self, tree="computer[displayName,offline,numExecutors,"
+                                 "monitorData[*]],busyExecutors,totalExecutors"):
+        """
+        Get the per-node list and the executor summary in one request.
+
+        Fuses what get_all_nodes plus a separate computer-info call would
+        fetch from /computer/api/json into a single tree-filtered response;
+        on agent-heavy instances the filtered monitorData is the dominant
+        saving.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            dict: The computer list plus busy and total executor counts.
+        """
+        return self._api_json("/computer", tree=tree)
 
     
+
+class JobHandle:
+    """
+    A handle on a single Jenkins job with its URL fragment formatted once.
+
+    Repeated operations against the same job reuse the quoted /job/<name>
+    path instead of re-quoting and re-concatenating it on every call.
+    """
+
+    def __init__(self, wrapper, name):
+        """
+        Initialize the handle for one job.
+
+        Args:
+            wrapper (JenkinsWrapper): Wrapper whose session and caches to use.
+            name (str): Name of the job.
+        """
+        self._wrapper = wrapper
+        self.name = name
+        self._path = _job_path(name)
+
+    def create(self, config_xml=None):
+        """
+        Create the job from an XML configuration.
+
+        Args:
+            config_xml (str or bytes, optional): Job configuration XML.
+                Defaults to the empty job configuration.
+        """
+        return self._wrapper.create_job(self.name, config_xml)
+
+    def info(self, tree="name,url,color,lastBuild[number,url,result,timestamp,duration]"):
+        """
+        Get tree-filtered information about the job.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            dict: Information about the job.
+        """
+        return self._wrapper._api_json(self._path, tree=tree)
+
+    def build(self):
+        """
+        Trigger a build of the job.
+
+        Returns:
+            int: Queue item number of the triggered build.
+        """
+        return self._wrapper.trigger_build(self.name)
+
+    def last_build(self, tree="lastBuild[number,url,result,timestamp,duration]"):
+        """
+        Get information about the job's last build.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            dict: Information about the last build.
+        """
+        return self._wrapper._api_json(self._path, tree=tree)['lastBuild']
+
+    def delete(self):
+        """
+        Delete the job.
+        """
+        return self._wrapper.delete_job(self.name)
+
+class FastJenkins:
+    """
+    A thin client for the handful of Jenkins REST endpoints this package
+    actually uses.
+
+    Every method is one GET or POST over a pooled keep-alive session - no
+    python-jenkins bookkeeping, per-call URL assembly or legacy code paths -
+    so the hot read endpoints get cheaper before any network-level tricks.
+    JenkinsWrapper remains the full-surface entry point; FastJenkins is for
+    callers that only need these endpoints and want the minimum overhead.
+    """
+
+    def __init__(self, server_url, username, password):
+        """
+        Initialize FastJenkins with server URL, username, and password.
+
+        Args:
+            server_url (str): URL of the Jenkins server.
+            username (str): Username for authentication.
+            password (str): Password for authentication.
+        """
+        self.server_url = server_url
+        self.session = requests.Session()
+        self.session.auth = (username, password)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._crumb_fetched = False
+
+    def _get(self, path, tree=None, depth=None):
+        """
+        GET an api/json endpoint and parse it with orjson.
+
+        Args:
+            path (str): Path below the server URL, e.g. '/job/my-job'.
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+            depth (int, optional): Jenkins depth parameter for nested fields.
+
+        Returns:
+            dict: Parsed JSON response.
+        """
+        params = {}
+        if tree:
+            params['tree'] = tree
+        if depth is not None:
+            params['depth'] = depth
+        response = self.session.get(f"{self.server_url}{path}/api/json", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _post(self, path, body=None, params=None, content_type=None):
+        """
+        POST to an endpoint, fetching the CSRF crumb once on first use.
+
+        Args:
+            path (str): Path below the server URL.
+            body (bytes, optional): Request body.
+            params (dict, optional): Query parameters.
+            content_type (str, optional): Content-Type header for the body.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        if not self._crumb_fetched:
+            response = self.session.get(f"{self.server_url}/crumbIssuer/api/json")
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                self.session.headers[data['crumbRequestField']] = data['crumb']
+            self._crumb_fetched = True
+        headers = {'Content-Type': content_type} if content_type else None
+        response = self.session.post(
+            f"{self.server_url}{path}", data=body, params=params, headers=headers
+        )
+        response.raise_for_status()
+        return response
+
+    def get_server_info(self):
+        """
+        Get the server's root api/json document.
+
+        Returns:
+            dict: Server information.
+        """
+        return self._get("")
+
+    def get_jobs(self, tree="jobs[name,url,color]"):
+        """
+        Get all jobs in one tree-filtered request.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            list: List of job dictionaries.
+        """
+        return self._get("", tree=tree)['jobs']
+
+    def get_job_info(self, job_name, tree=None):
+        """
+        Get information about a specific job.
+
+        Args:
+            job_name (str): Name of the job.
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            dict: Information about the job.
+        """
+        return self._get(_job_path(job_name), tree=tree)
+
+    def get_build_info(self, job_name, build_number, tree=None):
+        """
+        Get information about a specific build of a job.
+
+        Args:
+            job_name (str): Name of the job.
+            build_number (int): Build number.
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            dict: Information about the build.
+        """
+        return self._get(f"{_job_path(job_name)}/{build_number}", tree=tree)
+
+    def create_job(self, job_name, config_xml):
+        """
+        Create a job from an XML configuration.
+
+        Args:
+            job_name (str): Name of the job to create.
+            config_xml (str or bytes): Job configuration XML.
+        """
+        if isinstance(config_xml, str):
+            config_xml = config_xml.encode('utf-8')
+        return self._post(
+            "/createItem", body=config_xml, params={'name': job_name},
+            content_type='application/xml; charset=utf-8'
+        )
+
+    def delete_job(self, job_name):
+        """
+        Delete a job.
+
+        Args:
+            job_name (str): Name of the job to delete.
+        """
+        return self._post(f"{_job_path(job_name)}/doDelete")
+
+    def trigger_build(self, job_name):
+        """
+        Trigger a build and return its queue item number.
+
+        Args:
+            job_name (str): Name of the job to trigger the build for.
+
+        Returns:
+            int: Queue item number parsed from the Location header, or None.
+        """
+        response = self._post(f"{_job_path(job_name)}/build")
+        location = response.headers.get('Location', '')
+        if not location:
+            return None
+        return int(location.rstrip('/').rsplit('/', 1)[-1])
+
+    def get_views(self, tree="views[name,url]"):
+        """
+        Get all views in one tree-filtered request.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            list: List of view dictionaries.
+        """
+        return self._get("", tree=tree)['views']
+
+    def get_plugins(self, tree="plugins[shortName,version,active,enabled]"):
+        """
+        Get the installed plugins in one tree-filtered request.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            list: List of plugin dictionaries.
+        """
+        return self._get("/pluginManager", tree=tree, depth=1)['plugins']
+
+    def get_computers(self, tree="computer[displayName,offline,numExecutors],"
+                                 "busyExecutors,totalExecutors"):
+        """
+        Get the node list and executor summary in one request.
+
+        Args:
+            tree (str, optional): Jenkins tree expression limiting the returned fields.
+
+        Returns:
+            dict: The computer list plus busy and total executor counts.
+        """
+        return self._get("/computer", tree=tree)
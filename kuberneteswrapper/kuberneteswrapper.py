@@ -1,37 +1,587 @@
-from kubernetes import client, config
+import copy
+import functools
+import logging
+import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import urllib3
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
+logger = logging.getLogger(__name__)
+
+def _k8s_call(default):
+    """
+    Wrap an API-backed method so expected failures return a default value.
+
+    Failures are recorded through logging with lazy formatting instead of an
+    inline print, so the success path carries no I/O and error bursts no
+    longer serialize on stdout.
+
+    Args:
+        default: Value returned when the wrapped call raises ApiException.
+
+    Returns:
+        callable: The decorating function.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except ApiException as e:
+                logger.warning("%s failed with status %s: %s", fn.__name__, e.status, e.reason)
+                return default
+        return wrapper
+    return decorator
+
+# Manifest skeletons are built once at import; the create_* methods deep-copy
+# and fill them instead of rebuilding the nested dict literals on every call.
+_DEPLOYMENT_SKELETON = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {},
+    "spec": {
+        "selector": {"matchLabels": {}},
+        "template": {
+            "metadata": {"labels": {}},
+            "spec": {"containers": [{}]}
+        }
+    }
+}
+_SERVICE_SKELETON = {
+    "apiVersion": "v1",
+    "kind": "Service",
+    "metadata": {},
+    "spec": {"ports": [{}]}
+}
+_JOB_SKELETON = {
+    "apiVersion": "batch/v1",
+    "kind": "Job",
+    "metadata": {},
+    "spec": {
+        "template": {
+            "metadata": {},
+            "spec": {"containers": [{}], "restartPolicy": "Never"}
+        }
+    }
+}
+_CONFIG_MAP_SKELETON = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {}}
+_SECRET_SKELETON = {"apiVersion": "v1", "kind": "Secret", "metadata": {}}
+_NAMESPACE_SKELETON = {"apiVersion": "v1", "kind": "Namespace", "metadata": {}}
+
+@functools.lru_cache(maxsize=1)
+def _shared_configuration(context=None):
+    """
+    Load and cache the kubeconfig-derived client Configuration.
+
+    Parsing ~/.kube/config (and running any exec credential plugins, which
+    may shell out to cloud CLIs) can cost hundreds of milliseconds, so it is
+    done once per process and shared by every wrapper instance.
+
+    Args:
+        context (str, optional): Kubeconfig context to load. Defaults to the
+            current context.
+
+    Returns:
+        kubernetes.client.Configuration: The loaded configuration.
+    """
+    client_config = client.Configuration()
+    config.load_kube_config(client_configuration=client_config, context=context)
+    client_config.connection_pool_maxsize = 100
+    client_config.retries = urllib3.util.Retry(total=3, backoff_factor=0.1)
+    # Identify the client so API Priority and Fairness can attribute and
+    # flow-control our traffic instead of lumping it with the generic
+    # python client.
+    client_config.user_agent = f"minidof ({platform.system()})"
+    return client_config
+
+class _TokenBucket:
+    """
+    A thread-safe token bucket bounding the client-side request rate.
+    """
+
+    def __init__(self, qps, burst):
+        self.qps = qps
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a token is available, then consume it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.qps
+            time.sleep(wait)
+
+class ProjectedObject:
+    """
+    A trimmed projection of a watched Kubernetes object.
+
+    Only the fields callers typically read are kept - name, namespace, kind,
+    uid, resource_version, labels and status phase - so the cache holds a few
+    small attributes per object instead of the full API object graph.
+    """
+
+    __slots__ = ('name', 'namespace', 'kind', 'uid', 'resource_version', 'labels', 'phase')
+
+    def __init__(self, name, namespace, kind, uid, resource_version, labels, phase):
+        self.name = name
+        self.namespace = namespace
+        self.kind = kind
+        self.uid = uid
+        self.resource_version = resource_version
+        self.labels = labels
+        self.phase = phase
+
+def _project(obj, kind):
+    """
+    Project a full API object down to the fields kept in the cache.
+
+    Args:
+        obj: Full Kubernetes API object from a LIST or WATCH event.
+        kind (str): Resource kind of the object.
+
+    Returns:
+        ProjectedObject: The trimmed projection.
+    """
+    metadata = obj.metadata
+    status = getattr(obj, 'status', None)
+    return ProjectedObject(
+        name=metadata.name,
+        namespace=metadata.namespace,
+        kind=kind,
+        uid=metadata.uid,
+        resource_version=metadata.resource_version,
+        labels=metadata.labels,
+        phase=getattr(status, 'phase', None),
+    )
+
+class K8sCache:
+    """
+    An informer-style cache of Kubernetes objects.
+
+    Each watched (kind, namespace) pair is primed with one LIST and then kept
+    current by a background WATCH thread applying ADDED/MODIFIED/DELETED
+    events, so repeated reads become in-memory lookups instead of API calls.
+    Objects are stored as ProjectedObject instances, not full API objects;
+    callers needing full fidelity should pass raw=True to the list_* methods
+    to force a live API call.
+    """
+
+    def __init__(self):
+        self._store = {}
+        self._threads = {}
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def watch_resource(self, kind, list_func, namespace):
+        """
+        Start watching a resource kind in a namespace, if not already watched.
+
+        Args:
+            kind (str): Resource kind, e.g. "pod".
+            list_func (callable): The list_namespaced_* function for the kind.
+            namespace (str): Namespace to watch.
+        """
+        key = (kind, namespace)
+        with self._lock:
+            if key in self._threads:
+                return
+            thread = threading.Thread(
+                target=self._run, args=(key, list_func, namespace), daemon=True
+            )
+            self._threads[key] = thread
+        thread.start()
+
+    def _run(self, key, list_func, namespace):
+        """
+        List once, then apply watch events; re-list on 410 Gone.
+
+        Any other failure drops the cached snapshot (so readers fall back to
+        live LISTs rather than a frozen copy) and retries with backoff instead
+        of killing the thread.
+        """
+        watcher = watch.Watch()
+        backoff = 1
+        while not self._stopped:
+            try:
+                response = list_func(namespace, resource_version="0")
+                with self._lock:
+                    self._store[key] = {
+                        (obj.metadata.namespace, obj.metadata.name): _project(obj, key[0])
+                        for obj in response.items
+                    }
+                resource_version = response.metadata.resource_version
+                backoff = 1
+                for event in watcher.stream(
+                    list_func, namespace, resource_version=resource_version
+                ):
+                    obj = event['object']
+                    obj_key = (obj.metadata.namespace, obj.metadata.name)
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._store[key].pop(obj_key, None)
+                        else:
+                            self._store[key][obj_key] = _project(obj, key[0])
+            except Exception as e:
+                if isinstance(e, ApiException) and e.status == 410:
+                    # The resource version expired; loop around to re-list.
+                    continue
+                # Long-lived watch connections also die with transport errors
+                # (idle timeouts, LB resets), not just ApiException.
+                logger.warning("Watch on %s failed, retrying in %ss: %s", key, backoff, e)
+                with self._lock:
+                    self._store.pop(key, None)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def has(self, kind, namespace):
+        """
+        Check whether a (kind, namespace) pair is being watched.
+
+        Returns:
+            bool: True if a snapshot can be served from the cache.
+        """
+        with self._lock:
+            return (kind, namespace) in self._store
+
+    def snapshot(self, kind, namespace):
+        """
+        Get the current cached objects for a (kind, namespace) pair.
+
+        Returns:
+            list: Cached objects of the kind in the namespace.
+        """
+        with self._lock:
+            return list(self._store.get((kind, namespace), {}).values())
+
+    def stop(self):
+        """
+        Stop all watch threads after their current iteration.
+        """
+        self._stopped = True
+
 class KubernetesWrapper:
     """
     A wrapper class for the Kubernetes Python client library.
     """
 
-    def __init__(self):
+    def __init__(self, qps=50, burst=100, context=None):
         """
         Initialize the Kubernetes API client.
+
+        All API groups share one ApiClient, so they draw from a single
+        connection pool sized for concurrent callers instead of urllib3's
+        default of four keep-alive sockets. Requests pass through a token
+        bucket, so bursts above the configured rate queue client-side rather
+        than tripping API-server throttling.
+
+        Args:
+            qps (int, optional): Steady-state requests per second. Defaults to 50.
+            burst (int, optional): Maximum burst above the steady rate. Defaults to 100.
+            context (str, optional): Kubeconfig context to load. Defaults to the
+                current context.
+        """
+        client_config = _shared_configuration(context)
+        self.api_client = client.ApiClient(configuration=client_config)
+        self._limiter = _TokenBucket(qps, burst)
+        original_call_api = self.api_client.call_api
+
+        def rate_limited_call_api(*args, **kwargs):
+            self._limiter.acquire()
+            return original_call_api(*args, **kwargs)
+
+        self.api_client.call_api = rate_limited_call_api
+        # Large LIST responses compress roughly 10x; asking the API server to
+        # gzip them trades a little CPU for much less time on the wire.
+        self.api_client.set_default_header("Accept-Encoding", "gzip")
+        self.core_api = client.CoreV1Api(self.api_client)
+        self.apps_api = client.AppsV1Api(self.api_client)
+        self.batch_api = client.BatchV1Api(self.api_client)
+        self.custom_objects_api = client.CustomObjectsApi(self.api_client)
+        self._list_dispatch = {
+            "deployment": self.apps_api.list_namespaced_deployment,
+            "service": self.core_api.list_namespaced_service,
+            "pod": self.core_api.list_namespaced_pod,
+            "job": self.batch_api.list_namespaced_job,
+            "configmap": self.core_api.list_namespaced_config_map,
+            "secret": self.core_api.list_namespaced_secret,
+        }
+        self._list_all_dispatch = {
+            "deployment": self.apps_api.list_deployment_for_all_namespaces,
+            "service": self.core_api.list_service_for_all_namespaces,
+            "pod": self.core_api.list_pod_for_all_namespaces,
+            "job": self.batch_api.list_job_for_all_namespaces,
+            "configmap": self.core_api.list_config_map_for_all_namespaces,
+            "secret": self.core_api.list_secret_for_all_namespaces,
+        }
+        self._get_dispatch = {
+            "deployment": self.apps_api.read_namespaced_deployment,
+            "service": self.core_api.read_namespaced_service,
+            "pod": self.core_api.read_namespaced_pod,
+            "job": self.batch_api.read_namespaced_job,
+            "configmap": self.core_api.read_namespaced_config_map,
+            "secret": self.core_api.read_namespaced_secret,
+        }
+        self._delete_dispatch = {
+            "deployment": self.apps_api.delete_namespaced_deployment,
+            "service": self.core_api.delete_namespaced_service,
+            "pod": self.core_api.delete_namespaced_pod,
+            "job": self.batch_api.delete_namespaced_job,
+            "configmap": self.core_api.delete_namespaced_config_map,
+            "secret": self.core_api.delete_namespaced_secret,
+        }
+        self.cache = None
+
+    @classmethod
+    def reload_config(cls):
+        """
+        Force the next instantiation to re-parse the kubeconfig.
         """
-        config.load_kube_config()
-        self.core_api = client.CoreV1Api()
-        self.apps_api = client.AppsV1Api()
-        self.batch_api = client.BatchV1Api()
-        self.custom_objects_api = client.CustomObjectsApi()
+        _shared_configuration.cache_clear()
 
-    def list_pods(self, namespace=None):
+    def enable_cache(self, kinds, namespace):
+        """
+        Start informer-style caching for the given resource kinds.
+
+        Once enabled, the corresponding list_* calls are served from the
+        in-process cache instead of re-LISTing against the API server.
+
+        Args:
+            kinds (list): Resource kinds to watch (e.g. ["pod", "deployment"]).
+            namespace (str): Namespace to watch.
+        """
+        if self.cache is None:
+            self.cache = K8sCache()
+        for kind in kinds:
+            self.cache.watch_resource(kind, self._list_dispatch[kind], namespace)
+
+    def gather(self, *calls, max_workers=None):
+        """
+        Run several independent API calls concurrently.
+
+        The underlying client releases the GIL while blocked on the network,
+        so overlapping N calls bounds the wall time by the slowest response
+        instead of their sum.
+
+        Args:
+            *calls: Zero-argument callables, e.g. functools.partial-bound
+                wrapper methods.
+            max_workers (int, optional): Maximum concurrency. Defaults to one
+                worker per call.
+
+        Returns:
+            list: Results of the calls, in the order they were passed.
+        """
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def _iter_paged(self, list_func, chunk_size):
+        """
+        Iterate over a collection one page at a time.
+
+        Pages are fetched with the limit/continue mechanism, so the first
+        objects arrive after one small page instead of after the API server
+        has serialized the whole collection.
+
+        Args:
+            list_func (callable): Bound list function to page through.
+            chunk_size (int): Maximum number of objects per page.
+
+        Yields:
+            object: One API object at a time.
+        """
+        token = None
+        while True:
+            if token:
+                response = list_func(limit=chunk_size, _continue=token)
+            else:
+                response = list_func(limit=chunk_size)
+            yield from response.items
+            token = response.metadata._continue
+            if not token:
+                break
+
+    def iter_pods(self, namespace=None, chunk_size=500):
+        """
+        Iterate over pods in the specified namespace, page by page.
+
+        Args:
+            namespace (str, optional): Namespace to list pods from.
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One pod object at a time.
+        """
+        if namespace is None:
+            list_func = self.core_api.list_pod_for_all_namespaces
+        else:
+            list_func = partial(self.core_api.list_namespaced_pod, namespace)
+        return self._iter_paged(list_func, chunk_size)
+
+    def iter_deployments(self, namespace=None, chunk_size=500):
+        """
+        Iterate over deployments in the specified namespace, page by page.
+
+        Args:
+            namespace (str, optional): Namespace to list deployments from.
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One deployment object at a time.
+        """
+        if namespace is None:
+            list_func = self.apps_api.list_deployment_for_all_namespaces
+        else:
+            list_func = partial(self.apps_api.list_namespaced_deployment, namespace)
+        return self._iter_paged(list_func, chunk_size)
+
+    def iter_services(self, namespace=None, chunk_size=500):
+        """
+        Iterate over services in the specified namespace, page by page.
+
+        Args:
+            namespace (str, optional): Namespace to list services from.
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One service object at a time.
+        """
+        if namespace is None:
+            list_func = self.core_api.list_service_for_all_namespaces
+        else:
+            list_func = partial(self.core_api.list_namespaced_service, namespace)
+        return self._iter_paged(list_func, chunk_size)
+
+    def iter_config_maps(self, namespace=None, chunk_size=500):
+        """
+        Iterate over ConfigMaps in the specified namespace, page by page.
+
+        Args:
+            namespace (str, optional): Namespace to list ConfigMaps from.
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One ConfigMap object at a time.
+        """
+        if namespace is None:
+            list_func = self.core_api.list_config_map_for_all_namespaces
+        else:
+            list_func = partial(self.core_api.list_namespaced_config_map, namespace)
+        return self._iter_paged(list_func, chunk_size)
+
+    def iter_secrets(self, namespace=None, chunk_size=500):
+        """
+        Iterate over Secrets in the specified namespace, page by page.
+
+        Args:
+            namespace (str, optional): Namespace to list Secrets from.
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One Secret object at a time.
+        """
+        if namespace is None:
+            list_func = self.core_api.list_secret_for_all_namespaces
+        else:
+            list_func = partial(self.core_api.list_namespaced_secret, namespace)
+        return self._iter_paged(list_func, chunk_size)
+
+    def iter_jobs(self, namespace=None, chunk_size=500):
+        """
+        Iterate over jobs in the specified namespace, page by page.
+
+        Args:
+            namespace (str, optional): Namespace to list jobs from.
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One job object at a time.
+        """
+        if namespace is None:
+            list_func = self.batch_api.list_job_for_all_namespaces
+        else:
+            list_func = partial(self.batch_api.list_namespaced_job, namespace)
+        return self._iter_paged(list_func, chunk_size)
+
+    def iter_namespaces(self, chunk_size=500):
+        """
+        Iterate over namespaces, page by page.
+
+        Args:
+            chunk_size (int, optional): Objects fetched per page. Defaults to 500.
+
+        Yields:
+            object: One namespace object at a time.
+        """
+        token = None
+        while True:
+            if token:
+                response = self.core_api.list_namespace(limit=chunk_size, _continue=token)
+            else:
+                response = self.core_api.list_namespace(limit=chunk_size)
+            yield from response.items
+            token = response.metadata._continue
+            if not token:
+                break
+
+    @_k8s_call(default=[])
+    def list_pods(self, namespace=None, raw=False, consistent=False):
         """
         List pods in the specified namespace.
 
         Args:
             namespace (str, optional): Namespace to list pods from. Defaults to None (all namespaces).
+            raw (bool, optional): Bypass the cache and query the API directly. Defaults to False.
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
 
         Returns:
             list: List of pod objects.
         """
-        try:
-            return self.core_api.list_namespaced_pod(namespace)
-        except ApiException as e:
-            print(f"Error listing pods: {e}")
-            return []
+        if not raw and self.cache is not None and self.cache.has("pod", namespace):
+            return self.cache.snapshot("pod", namespace)
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        if namespace is None:
+            return self.core_api.list_pod_for_all_namespaces(**list_kwargs)
+        return self.core_api.list_namespaced_pod(namespace, **list_kwargs)
+
+    @_k8s_call(default=None)
+    def get_pod(self, name, namespace):
+        """
+        Get a pod by name.
 
+        Prefer this over listing the namespace and filtering client-side:
+        the server does O(1) work and returns a single object.
+
+        Args:
+            name (str): Name of the pod.
+            namespace (str): Namespace of the pod.
+
+        Returns:
+            dict: Pod object.
+        """
+        return self.core_api.read_namespaced_pod(name, namespace)
+
+    @_k8s_call(default=None)
     def create_deployment(self, name, namespace, image, replicas=1):
         """
         Create a deployment.
@@ -45,30 +595,19 @@ class KubernetesWrapper:
         Returns:
             dict: Deployment object.
         """
-        deployment = {
-            "apiVersion": "apps/v1",
-            "kind": "Deployment",
-            "metadata": {
-                "name": name,
-                "namespace": namespace
-            },
-            "spec": {
-                "replicas": replicas,
-                "selector": {
-                    "matchLabels": {"app": name}
-                },
-                "template": {
-                    "metadata": {"labels": {"app": name}},
-                    "spec": {"containers": [{"name": name, "image": image}]}
-                }
-            }
-        }
-        try:
-            return self.apps_api.create_namespaced_deployment(namespace, body=deployment)
-        except ApiException as e:
-            print(f"Error creating deployment: {e}")
-            return None
-
+        deployment = copy.deepcopy(_DEPLOYMENT_SKELETON)
+        deployment["metadata"]["name"] = name
+        deployment["metadata"]["namespace"] = namespace
+        spec = deployment["spec"]
+        spec["replicas"] = replicas
+        spec["selector"]["matchLabels"]["app"] = name
+        spec["template"]["metadata"]["labels"]["app"] = name
+        container = spec["template"]["spec"]["containers"][0]
+        container["name"] = name
+        container["image"] = image
+        return self.apps_api.create_namespaced_deployment(namespace, body=deployment)
+
+    @_k8s_call(default=None)
     def delete_deployment(self, name, namespace):
         """
         Delete a deployment.
@@ -77,28 +616,49 @@ class KubernetesWrapper:
             name (str): Name of the deployment.
             namespace (str): Namespace of the deployment.
         """
-        try:
-            return self.apps_api.delete_namespaced_deployment(name, namespace)
-        except ApiException as e:
-            print(f"Error deleting deployment: {e}")
-            return None
+        return self.apps_api.delete_namespaced_deployment(name, namespace)
 
-    def list_deployments(self, namespace=None):
+    @_k8s_call(default=[])
+    def list_deployments(self, namespace=None, raw=False, consistent=False):
         """
         List deployments in the specified namespace.
 
         Args:
             namespace (str, optional): Namespace to list deployments from. Defaults to None (all namespaces).
+            raw (bool, optional): Bypass the cache and query the API directly. Defaults to False.
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
 
         Returns:
             list: List of deployment objects.
         """
-        try:
-            return self.apps_api.list_namespaced_deployment(namespace)
-        except ApiException as e:
-            print(f"Error listing deployments: {e}")
-            return []
+        if not raw and self.cache is not None and self.cache.has("deployment", namespace):
+            return self.cache.snapshot("deployment", namespace)
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        if namespace is None:
+            return self.apps_api.list_deployment_for_all_namespaces(**list_kwargs)
+        return self.apps_api.list_namespaced_deployment(namespace, **list_kwargs)
+
+    @_k8s_call(default=None)
+    def get_deployment(self, name, namespace):
+        """
+        Get a deployment by name.
+
+        Prefer this over listing the namespace and filtering client-side:
+        the server does O(1) work and returns a single object.
+
+        Args:
+            name (str): Name of the deployment.
+            namespace (str): Namespace of the deployment.
 
+        Returns:
+            dict: Deployment object.
+        """
+        return self.apps_api.read_namespaced_deployment(name, namespace)
+
+    @_k8s_call(default=None)
     def create_service(self, name, namespace, service_type, port, target_port):
         """
         Create a service.
@@ -113,24 +673,15 @@ class KubernetesWrapper:
         Returns:
             dict: Service object.
         """
-        service = {
-            "apiVersion": "v1",
-            "kind": "Service",
-            "metadata": {
-                "name": name,
-                "namespace": namespace
-            },
-            "spec": {
-                "type": service_type,
-                "ports": [{"port": port, "targetPort": target_port}]
-            }
-        }
-        try:
-            return self.core_api.create_namespaced_service(namespace, body=service)
-        except ApiException as e:
-            print(f"Error creating service: {e}")
-            return None
-
+        service = copy.deepcopy(_SERVICE_SKELETON)
+        service["metadata"]["name"] = name
+        service["metadata"]["namespace"] = namespace
+        service["spec"]["type"] = service_type
+        service["spec"]["ports"][0]["port"] = port
+        service["spec"]["ports"][0]["targetPort"] = target_port
+        return self.core_api.create_namespaced_service(namespace, body=service)
+
+    @_k8s_call(default=None)
     def delete_service(self, name, namespace):
         """
         Delete a service.
@@ -139,28 +690,49 @@ class KubernetesWrapper:
             name (str): Name of the service.
             namespace (str): Namespace of the service.
         """
-        try:
-            return self.core_api.delete_namespaced_service(name, namespace)
-        except ApiException as e:
-            print(f"Error deleting service: {e}")
-            return None
+        return self.core_api.delete_namespaced_service(name, namespace)
 
-    def list_services(self, namespace=None):
+    @_k8s_call(default=[])
+    def list_services(self, namespace=None, raw=False, consistent=False):
         """
         List services in the specified namespace.
 
         Args:
             namespace (str, optional): Namespace to list services from. Defaults to None (all namespaces).
+            raw (bool, optional): Bypass the cache and query the API directly. Defaults to False.
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
 
         Returns:
             list: List of service objects.
         """
-        try:
-            return self.core_api.list_namespaced_service(namespace)
-        except ApiException as e:
-            print(f"Error listing services: {e}")
-            return []
+        if not raw and self.cache is not None and self.cache.has("service", namespace):
+            return self.cache.snapshot("service", namespace)
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        if namespace is None:
+            return self.core_api.list_service_for_all_namespaces(**list_kwargs)
+        return self.core_api.list_namespaced_service(namespace, **list_kwargs)
+
+    @_k8s_call(default=None)
+    def get_service(self, name, namespace):
+        """
+        Get a service by name.
+
+        Prefer this over listing the namespace and filtering client-side:
+        the server does O(1) work and returns a single object.
 
+        Args:
+            name (str): Name of the service.
+            namespace (str): Namespace of the service.
+
+        Returns:
+            dict: Service object.
+        """
+        return self.core_api.read_namespaced_service(name, namespace)
+
+    @_k8s_call(default=None)
     def create_job(self, name, namespace, image, command, completions=1, parallelism=1):
         """
         Create a job.
@@ -176,35 +748,20 @@ class KubernetesWrapper:
         Returns:
             dict: Job object.
         """
-        job = {
-            "apiVersion": "batch/v1",
-            "kind": "Job",
-            "metadata": {
-                "name": name,
-                "namespace": namespace
-            },
-            "spec": {
-                "completions": completions,
-                "parallelism": parallelism,
-                "template": {
-                    "metadata": {"name": name},
-                    "spec": {
-                        "containers": [{
-                            "name": name,
-                            "image": image,
-                            "command": command
-                        }],
-                        "restartPolicy": "Never"
-                    }
-                }
-            }
-        }
-        try:
-            return self.batch_api.create_namespaced_job(namespace, body=job)
-        except ApiException as e:
-            print(f"Error creating job: {e}")
-            return None
-
+        job = copy.deepcopy(_JOB_SKELETON)
+        job["metadata"]["name"] = name
+        job["metadata"]["namespace"] = namespace
+        spec = job["spec"]
+        spec["completions"] = completions
+        spec["parallelism"] = parallelism
+        spec["template"]["metadata"]["name"] = name
+        container = spec["template"]["spec"]["containers"][0]
+        container["name"] = name
+        container["image"] = image
+        container["command"] = command
+        return self.batch_api.create_namespaced_job(namespace, body=job)
+
+    @_k8s_call(default=None)
     def delete_job(self, name, namespace):
         """
         Delete a job.
@@ -213,28 +770,49 @@ class KubernetesWrapper:
             name (str): Name of the job.
             namespace (str): Namespace of the job.
         """
-        try:
-            return self.batch_api.delete_namespaced_job(name, namespace)
-        except ApiException as e:
-            print(f"Error deleting job: {e}")
-            return None
+        return self.batch_api.delete_namespaced_job(name, namespace)
 
-    def list_jobs(self, namespace=None):
+    @_k8s_call(default=[])
+    def list_jobs(self, namespace=None, raw=False, consistent=False):
         """
         List jobs in the specified namespace.
 
         Args:
             namespace (str, optional): Namespace to list jobs from. Defaults to None (all namespaces).
+            raw (bool, optional): Bypass the cache and query the API directly. Defaults to False.
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
 
         Returns:
             list: List of job objects.
         """
-        try:
-            return self.batch_api.list_namespaced_job(namespace)
-        except ApiException as e:
-            print(f"Error listing jobs: {e}")
-            return []
+        if not raw and self.cache is not None and self.cache.has("job", namespace):
+            return self.cache.snapshot("job", namespace)
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        if namespace is None:
+            return self.batch_api.list_job_for_all_namespaces(**list_kwargs)
+        return self.batch_api.list_namespaced_job(namespace, **list_kwargs)
+
+    @_k8s_call(default=None)
+    def get_job(self, name, namespace):
+        """
+        Get a job by name.
+
+        Prefer this over listing the namespace and filtering client-side:
+        the server does O(1) work and returns a single object.
 
+        Args:
+            name (str): Name of the job.
+            namespace (str): Namespace of the job.
+
+        Returns:
+            dict: Job object.
+        """
+        return self.batch_api.read_namespaced_job(name, namespace)
+
+    @_k8s_call(default=None)
     def create_config_map(self, name, namespace, data):
         """
         Create a ConfigMap.
@@ -249,21 +827,13 @@ class KubernetesWrapper:
 
 
         """
-        config_map = {
-            "apiVersion": "v1",
-            "kind": "ConfigMap",
-            "metadata": {
-                "name": name,
-                "namespace": namespace
-            },
-            "data": data
-        }
-        try:
-            return self.core_api.create_namespaced_config_map(namespace, body=config_map)
-        except ApiException as e:
-            print(f"Error creating ConfigMap: {e}")
-            return None
+        config_map = copy.deepcopy(_CONFIG_MAP_SKELETON)
+        config_map["metadata"]["name"] = name
+        config_map["metadata"]["namespace"] = namespace
+        config_map["data"] = data
+        return self.core_api.create_namespaced_config_map(namespace, body=config_map)
 
+    @_k8s_call(default=None)
     def delete_config_map(self, name, namespace):
         """
         Delete a ConfigMap.
@@ -272,28 +842,49 @@ class KubernetesWrapper:
             name (str): Name of the ConfigMap.
             namespace (str): Namespace of the ConfigMap.
         """
-        try:
-            return self.core_api.delete_namespaced_config_map(name, namespace)
-        except ApiException as e:
-            print(f"Error deleting ConfigMap: {e}")
-            return None
+        return self.core_api.delete_namespaced_config_map(name, namespace)
 
-    def list_config_maps(self, namespace=None):
+    @_k8s_call(default=[])
+    def list_config_maps(self, namespace=None, raw=False, consistent=False):
         """
         List ConfigMaps in the specified namespace.
 
         Args:
             namespace (str, optional): Namespace to list ConfigMaps from. Defaults to None (all namespaces).
+            raw (bool, optional): Bypass the cache and query the API directly. Defaults to False.
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
 
         Returns:
             list: List of ConfigMap objects.
         """
-        try:
-            return self.core_api.list_namespaced_config_map(namespace)
-        except ApiException as e:
-            print(f"Error listing ConfigMaps: {e}")
-            return []
+        if not raw and self.cache is not None and self.cache.has("configmap", namespace):
+            return self.cache.snapshot("configmap", namespace)
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        if namespace is None:
+            return self.core_api.list_config_map_for_all_namespaces(**list_kwargs)
+        return self.core_api.list_namespaced_config_map(namespace, **list_kwargs)
 
+    @_k8s_call(default=None)
+    def get_config_map(self, name, namespace):
+        """
+        Get a ConfigMap by name.
+
+        Prefer this over listing the namespace and filtering client-side:
+        the server does O(1) work and returns a single object.
+
+        Args:
+            name (str): Name of the ConfigMap.
+            namespace (str): Namespace of the ConfigMap.
+
+        Returns:
+            dict: ConfigMap object.
+        """
+        return self.core_api.read_namespaced_config_map(name, namespace)
+
+    @_k8s_call(default=None)
     def create_secret(self, name, namespace, data):
         """
         Create a Secret.
@@ -306,21 +897,13 @@ class KubernetesWrapper:
         Returns:
             dict: Secret object.
         """
-        secret = {
-            "apiVersion": "v1",
-            "kind": "Secret",
-            "metadata": {
-                "name": name,
-                "namespace": namespace
-            },
-            "data": data
-        }
-        try:
-            return self.core_api.create_namespaced_secret(namespace, body=secret)
-        except ApiException as e:
-            print(f"Error creating Secret: {e}")
-            return None
+        secret = copy.deepcopy(_SECRET_SKELETON)
+        secret["metadata"]["name"] = name
+        secret["metadata"]["namespace"] = namespace
+        secret["data"] = data
+        return self.core_api.create_namespaced_secret(namespace, body=secret)
 
+    @_k8s_call(default=None)
     def delete_secret(self, name, namespace):
         """
         Delete a Secret.
@@ -329,28 +912,49 @@ class KubernetesWrapper:
             name (str): Name of the Secret.
             namespace (str): Namespace of the Secret.
         """
-        try:
-            return self.core_api.delete_namespaced_secret(name, namespace)
-        except ApiException as e:
-            print(f"Error deleting Secret: {e}")
-            return None
+        return self.core_api.delete_namespaced_secret(name, namespace)
 
-    def list_secrets(self, namespace=None):
+    @_k8s_call(default=[])
+    def list_secrets(self, namespace=None, raw=False, consistent=False):
         """
         List Secrets in the specified namespace.
 
         Args:
             namespace (str, optional): Namespace to list Secrets from. Defaults to None (all namespaces).
+            raw (bool, optional): Bypass the cache and query the API directly. Defaults to False.
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
 
         Returns:
             list: List of Secret objects.
         """
-        try:
-            return self.core_api.list_namespaced_secret(namespace)
-        except ApiException as e:
-            print(f"Error listing Secrets: {e}")
-            return []
+        if not raw and self.cache is not None and self.cache.has("secret", namespace):
+            return self.cache.snapshot("secret", namespace)
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        if namespace is None:
+            return self.core_api.list_secret_for_all_namespaces(**list_kwargs)
+        return self.core_api.list_namespaced_secret(namespace, **list_kwargs)
+
+    @_k8s_call(default=None)
+    def get_secret(self, name, namespace):
+        """
+        Get a Secret by name.
+
+        Prefer this over listing the namespace and filtering client-side:
+        the server does O(1) work and returns a single object.
 
+        Args:
+            name (str): Name of the Secret.
+            namespace (str): Namespace of the Secret.
+
+        Returns:
+            dict: Secret object.
+        """
+        return self.core_api.read_namespaced_secret(name, namespace)
+
+    @_k8s_call(default=None)
     def create_namespace(self, name):
         """
         Create a namespace.
@@ -361,17 +965,11 @@ class KubernetesWrapper:
         Returns:
             dict: Namespace object.
         """
-        namespace = {
-            "apiVersion": "v1",
-            "kind": "Namespace",
-            "metadata": {"name": name}
-        }
-        try:
-            return self.core_api.create_namespace(body=namespace)
-        except ApiException as e:
-            print(f"Error creating namespace: {e}")
-            return None
+        namespace = copy.deepcopy(_NAMESPACE_SKELETON)
+        namespace["metadata"]["name"] = name
+        return self.core_api.create_namespace(body=namespace)
 
+    @_k8s_call(default=None)
     def delete_namespace(self, name):
         """
         Delete a namespace.
@@ -379,25 +977,84 @@ class KubernetesWrapper:
         Args:
             name (str): Name of the namespace.
         """
-        try:
-            return self.core_api.delete_namespace(name)
-        except ApiException as e:
-            print(f"Error deleting namespace: {e}")
-            return None
+        return self.core_api.delete_namespace(name)
 
-    def list_namespaces(self):
+    @_k8s_call(default=[])
+    def list_namespaces(self, consistent=False):
         """
         List namespaces.
 
+        Args:
+            consistent (bool, optional): Force a quorum read from etcd. Defaults to
+                False, which lets the API server answer from its watch cache.
+
         Returns:
             list: List of namespace objects.
         """
-        try:
-            return self.core_api.list_namespace()
-        except ApiException as e:
-            print(f"Error listing namespaces: {e}")
-            return []
+        list_kwargs = {} if consistent else {
+            "resource_version": "0", "resource_version_match": "NotOlderThan"
+        }
+        return self.core_api.list_namespace(**list_kwargs)
+
+    @_k8s_call(default=None)
+    def get_namespace(self, name):
+        """
+        Get a namespace by name.
 
+        Args:
+            name (str): Name of the namespace.
+
+        Returns:
+            dict: Namespace object.
+        """
+        return self.core_api.read_namespace(name)
+
+    def apply_batch(self, manifests, max_workers=8):
+        """
+        Create several resources concurrently from manifest dictionaries.
+
+        Provisioning a full application (deployment + service + ConfigMap +
+        Secret) costs roughly one round-trip instead of N sequential ones.
+
+        Args:
+            manifests (list): Kubernetes manifest dictionaries.
+            max_workers (int, optional): Maximum concurrency. Defaults to 8.
+
+        Returns:
+            list: Created objects, in the same order as the manifests.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._apply_one, manifests)
+        return list(results)
+
+    @_k8s_call(default=None)
+    def _apply_one(self, manifest):
+        """
+        Create a single resource from a manifest dictionary.
+
+        Args:
+            manifest (dict): Kubernetes manifest.
+
+        Returns:
+            dict: Created object, or None if the call failed.
+        """
+        kind = manifest.get("kind", "")
+        namespace = manifest.get("metadata", {}).get("namespace")
+        create_funcs = {
+            "Deployment": self.apps_api.create_namespaced_deployment,
+            "Service": self.core_api.create_namespaced_service,
+            "Job": self.batch_api.create_namespaced_job,
+            "ConfigMap": self.core_api.create_namespaced_config_map,
+            "Secret": self.core_api.create_namespaced_secret,
+        }
+        if kind == "Namespace":
+            return self.core_api.create_namespace(body=manifest)
+        create = create_funcs.get(kind)
+        if create is None:
+            return self.apply_manifest(manifest)
+        return create(namespace, body=manifest)
+
+    @_k8s_call(default=None)
     def apply_manifest(self, manifest):
         """
         Apply Kubernetes manifest.
@@ -408,18 +1065,15 @@ class KubernetesWrapper:
         Returns:
             dict: Applied object.
         """
-        try:
-            return self.custom_objects_api.create_namespaced_custom_object(
-                group="apps",
-                version="v1",
-                namespace=manifest["metadata"]["namespace"],
-                plural="deployments",
-                body=manifest
-            )
-        except ApiException as e:
-            print(f"Error applying manifest: {e}")
-            return None
-
+        return self.custom_objects_api.create_namespaced_custom_object(
+            group="apps",
+            version="v1",
+            namespace=manifest["metadata"]["namespace"],
+            plural="deployments",
+            body=manifest
+        )
+
+    @_k8s_call(default=False)
     def delete_resource(self, resource_type, name, namespace=None):
         """
         Delete a Kubernetes resource.
@@ -431,17 +1085,17 @@ class KubernetesWrapper:
 
         Returns:
             bool: True if the resource is deleted successfully, False otherwise.
+
+        Raises:
+            ValueError: If the resource type is not supported.
         """
         try:
-            if resource_type == "deployment":
-                return self.apps_api.delete_namespaced_deployment(name, namespace)
-            elif resource_type == "service":
-                return self.core_api.delete_namespaced_service(name, namespace)
-            # Add more resource types as needed...
-        except ApiException as e:
-            print(f"Error deleting resource: {e}")
-            return False
+            delete = self._delete_dispatch[resource_type]
+        except KeyError:
+            raise ValueError(f"Unsupported resource type: {resource_type}")
+        return delete(name, namespace)
 
+    @_k8s_call(default=None)
     def get_resource(self, resource_type, name, namespace=None):
         """
         Get details of a Kubernetes resource.
@@ -453,34 +1107,35 @@ class KubernetesWrapper:
 
         Returns:
             dict: Details of the resource.
+
+        Raises:
+            ValueError: If the resource type is not supported.
         """
         try:
-            if resource_type == "deployment":
-                return self.apps_api.read_namespaced_deployment(name, namespace)
-            elif resource_type == "service":
-                return self.core_api.read_namespaced_service(name, namespace)
-            # Add more resource types as needed...
-        except ApiException as e:
-            print(f"Error getting resource: {e}")
-            return None
+            read = self._get_dispatch[resource_type]
+        except KeyError:
+            raise ValueError(f"Unsupported resource type: {resource_type}")
+        return read(name, namespace)
 
+    @_k8s_call(default=[])
     def list_resources(self, resource_type, namespace=None):
         """
         List Kubernetes resources of a specific type.
 
         Args:
             resource_type (str): Type of the Kubernetes resource (e.g., "deployment", "service").
-            namespace (str, optional): Namespace of the resource. Defaults to None.
+            namespace (str, optional): Namespace of the resource. Defaults to None
+                (all namespaces).
 
         Returns:
             list: List of resources.
+
+        Raises:
+            ValueError: If the resource type is not supported.
         """
+        dispatch = self._list_dispatch if namespace else self._list_all_dispatch
         try:
-            if resource_type == "deployment":
-                return self.apps_api.list_namespaced_deployment(namespace)
-            elif resource_type == "service":
-                return self.core_api.list_namespaced_service(namespace)
-            # Add more resource types as needed...
-        except ApiException as e:
-            print(f"Error listing resources: {e}")
-            return []
\ No newline at end of file
+            list_func = dispatch[resource_type]
+        except KeyError:
+            raise ValueError(f"Unsupported resource type: {resource_type}")
+        return list_func(namespace) if namespace else list_func()
@@ -1,5 +1,10 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import docker
 
+_shared_docker_client = functools.lru_cache(maxsize=1)(docker.from_env)
+
 class DockerWrapper:
     """
     A wrapper class for Docker functionalities.
@@ -8,8 +13,19 @@ class DockerWrapper:
     def __init__(self):
         """
         Initializes the Docker client.
+
+        The underlying client is created once per process and shared across
+        wrapper instances, so repeated constructions skip the socket open and
+        API version probe.
         """
-        self.client = docker.from_env()
+        self.client = _shared_docker_client()
+
+    @classmethod
+    def reset_client(cls):
+        """
+        Drops the shared client so the next instantiation reconnects.
+        """
+        _shared_docker_client.cache_clear()
 
     def list_containers(self):
         """
@@ -40,8 +56,7 @@ class DockerWrapper:
         Parameters:
         - container_id (str): The ID of the container to stop.
         """
-        container = self.client.containers.get(container_id)
-        container.stop()
+        self.client.api.stop(container_id)
 
     def remove_container(self, container_id):
         """
@@ -50,8 +65,7 @@ class DockerWrapper:
         Parameters:
         - container_id (str): The ID of the container to remove.
         """
-        container = self.client.containers.get(container_id)
-        container.remove()
+        self.client.api.remove_container(container_id)
 
     def list_images(self):
         """
@@ -137,8 +151,7 @@ class DockerWrapper:
         Parameters:
         - name (str): The name of the volume to remove.
         """
-        volume = self.client.volumes.get(name)
-        volume.remove()
+        self.client.api.remove_volume(name)
 
     def list_networks(self):
         """
@@ -166,8 +179,7 @@ class DockerWrapper:
         Parameters:
         - name (str): The name of the network to remove.
         """
-        network = self.client.networks.get(name)
-        network.remove()
+        self.client.api.remove_network(name)
 
     def prune_containers(self):
         """
@@ -217,11 +229,10 @@ class DockerWrapper:
         Returns:
         - str: The logs if logs=True and stream=False.
         """
-        container = self.client.containers.get(container_id)
         if logs:
-            return container.logs(stream=stream)
+            return self.client.api.logs(container_id, stream=stream)
         else:
-            return container.attach(stream=stream)
+            return self.client.api.attach(container_id, stream=stream)
 
     # New functionalities
 
@@ -256,8 +267,7 @@ class DockerWrapper:
         Parameters:
         - service_id (str): The ID of the service to remove.
         """
-        service = self.client.services.get(service_id)
-        service.remove()
+        self.client.api.remove_service(service_id)
 
     def inspect_service(self, service_id):
         """
@@ -282,8 +292,10 @@ class DockerWrapper:
         Returns:
         - tuple: A tuple containing exit code and output of the command.
         """
-        container = self.client.containers.get(container_id)
-        return container.exec_run(command)
+        exec_id = self.client.api.exec_create(container_id, command)
+        output = self.client.api.exec_start(exec_id)
+        exit_code = self.client.api.exec_inspect(exec_id)['ExitCode']
+        return exit_code, output
 
     def create_secret(self, name, data):
         """
@@ -314,8 +326,7 @@ class DockerWrapper:
         Parameters:
         - secret_id (str): The ID of the secret to remove.
         """
-        secret = self.client.secrets.get(secret_id)
-        secret.remove()
+        self.client.api.remove_secret(secret_id)
 
     def create_config(self, name, data):
         """
@@ -346,8 +357,7 @@ class DockerWrapper:
         Parameters:
         - config_id (str): The ID of the config to remove.
         """
-        config = self.client.configs.get(config_id)
-        config.remove()
+        self.client.api.remove_config(config_id)
 
     def get_stats(self, container_id):
         """
@@ -359,8 +369,40 @@ class DockerWrapper:
         Returns:
         - dict: A dictionary containing real-time statistics of the container.
         """
-        container = self.client.containers.get(container_id)
-        return container.stats(stream=False)
+        return self.client.api.stats(container_id, stream=False)
+
+    def get_stats_bulk(self, container_ids, max_workers=32):
+        """
+        Gets statistics for many containers concurrently.
+
+        Each stats snapshot blocks about a second while dockerd samples CPU
+        twice, so fetching them concurrently bounds the total wait by one
+        sample window instead of one per container.
+
+        Parameters:
+        - container_ids (list): The IDs of the containers to query.
+        - max_workers (int): Maximum number of concurrent requests (default is 32).
+
+        Returns:
+        - dict: A dictionary mapping container ID to its statistics.
+        """
+        if not container_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(container_ids))) as executor:
+            stats = executor.map(self.get_stats, container_ids)
+        return dict(zip(container_ids, stats))
+
+    def stream_stats(self, container_id):
+        """
+        Streams statistics of a Docker container as they are produced.
+
+        Parameters:
+        - container_id (str): The ID of the container.
+
+        Yields:
+        - dict: The next statistics sample for the container.
+        """
+        yield from self.client.api.stats(container_id, stream=True, decode=True)
 
     def rename_container(self, container_id, new_name):
         """
@@ -370,8 +412,7 @@ class DockerWrapper:
         - container_id (str): The ID of the container to rename.
         - new_name (str): The new name for the container.
         """
-        container = self.client.containers.get(container_id)
-        container.rename(new_name)
+        self.client.api.rename(container_id, new_name)
 
     def prune_secrets(self):
         """
@@ -427,6 +468,29 @@ class DockerWrapper:
         """
         return self.client.api.prune_system()
 
+    def prune_all(self, max_workers=8):
+        """
+        Prunes unused containers, images, volumes, networks, secrets, configs,
+        services and builds concurrently.
+
+        Each prune is a separate dockerd round trip, so fanning them out
+        bounds a full cleanup by the slowest prune instead of their sum.
+
+        Parameters:
+        - max_workers (int): Maximum number of concurrent prunes (default is 8).
+
+        Returns:
+        - dict: A dictionary mapping each prune operation name to its result.
+        """
+        operations = (
+            "prune_containers", "prune_images", "prune_volumes",
+            "prune_networks", "prune_secrets", "prune_configs",
+            "prune_services", "prune_builds",
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(getattr(self, name)) for name in operations}
+        return {name: future.result() for name, future in futures.items()}
+
     def get_node(self, node_id):
         """
         Gets information about a Docker node.
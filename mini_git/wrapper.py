@@ -10,6 +10,17 @@ class GitWrapper:
         - repo_path (str): Path to the Git repository.
         """
         self.repo = git.Repo(repo_path)
+        self._meta_cache = {}
+
+    def _invalidate_meta(self, *keys):
+        """
+        Drops the given keys from the metadata cache.
+
+        Parameters:
+        - keys (str): Cache keys to drop.
+        """
+        for key in keys:
+            self._meta_cache.pop(key, None)
 
     def get_branches(self):
         """
@@ -18,7 +29,10 @@ class GitWrapper:
         Returns:
         - List[str]: List of branch names.
         """
-        return [str(branch) for branch in self.repo.branches]
+        if 'branches' not in self._meta_cache:
+            output = self.repo.git.for_each_ref('refs/heads/', format='%(refname:short)')
+            self._meta_cache['branches'] = output.splitlines()
+        return self._meta_cache['branches']
 
     def get_tags(self):
         """
@@ -27,7 +41,10 @@ class GitWrapper:
         Returns:
         - List[str]: List of tag names.
         """
-        return [str(tag) for tag in self.repo.tags]
+        if 'tags' not in self._meta_cache:
+            output = self.repo.git.for_each_ref('refs/tags/', format='%(refname:short)')
+            self._meta_cache['tags'] = output.splitlines()
+        return self._meta_cache['tags']
 
     def get_current_branch(self):
         """
@@ -36,7 +53,9 @@ class GitWrapper:
         Returns:
         - str: Name of the current branch.
         """
-        return str(self.repo.active_branch)
+        if 'current_branch' not in self._meta_cache:
+            self._meta_cache['current_branch'] = str(self.repo.active_branch)
+        return self._meta_cache['current_branch']
 
     def create_branch(self, branch_name, base_branch='master'):
         """
@@ -51,6 +70,7 @@ class GitWrapper:
         """
         try:
             self.repo.create_head(branch_name, base=self.repo.head.reference)
+            self._invalidate_meta('branches')
             return True
         except GitCommandError:
             return False
@@ -67,6 +87,7 @@ class GitWrapper:
         """
         try:
             self.repo.delete_head(branch_name)
+            self._invalidate_meta('branches')
             return True
         except GitCommandError:
             return False
@@ -95,8 +116,11 @@ class GitWrapper:
         Returns:
         - List[str]: List of commit IDs.
         """
-        commits = self.repo.iter_commits(branch, max_count=limit)
-        return [commit.hexsha for commit in commits]
+        if limit is None:
+            output = self.repo.git.rev_list(branch)
+        else:
+            output = self.repo.git.rev_list(branch, max_count=limit)
+        return output.splitlines()
 
     def commit_changes(self, message):
         """
@@ -137,6 +161,7 @@ class GitWrapper:
         """
         try:
             self.repo.remote(name=remote_name).pull(branch_name)
+            self._invalidate_meta('tags')
             return True
         except GitCommandError:
             return False
@@ -153,6 +178,7 @@ class GitWrapper:
         """
         try:
             self.repo.remote(name=remote_name).fetch()
+            self._invalidate_meta('tags')
             return True
         except GitCommandError:
             return False
@@ -203,6 +229,7 @@ class GitWrapper:
         """
         try:
             self.repo.create_remote(name, url)
+            self._invalidate_meta(('remote_url', name))
             return True
         except GitCommandError:
             return False
@@ -219,6 +246,7 @@ class GitWrapper:
         """
         try:
             self.repo.delete_remote(name)
+            self._invalidate_meta(('remote_url', name))
             return True
         except GitCommandError:
             return False
@@ -237,6 +265,29 @@ class GitWrapper:
         diff = self.repo.git.diff(ref_a, ref_b)
         return diff
 
+    def iter_diff(self, ref_a='HEAD', ref_b=None, chunk_size=1 << 16):
+        """
+        Streams the difference between two references chunk by chunk.
+
+        Unlike get_diff, the patch is never materialized as one string, so
+        peak memory stays bounded by chunk_size even for very large diffs.
+
+        Parameters:
+        - ref_a (str): First reference. Defaults to 'HEAD'.
+        - ref_b (str): Second reference. Defaults to None.
+        - chunk_size (int): Size in bytes of each streamed chunk. Defaults to 64 KiB.
+
+        Yields:
+        - bytes: Next chunk of the diff output.
+        """
+        process = self.repo.git.diff(ref_a, ref_b, as_process=True)
+        while True:
+            chunk = process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        process.wait()
+
     def add_files(self, file_paths):
         """
         Adds files to the index for staging.
@@ -244,7 +295,9 @@ class GitWrapper:
         Parameters:
         - file_paths (List[str]): List of file paths to add.
         """
-        self.repo.index.add(file_paths)
+        batch_size = 1000
+        for start in range(0, len(file_paths), batch_size):
+            self.repo.git.add('--', *file_paths[start:start + batch_size])
 
     def checkout(self, ref):
         """
@@ -258,6 +311,7 @@ class GitWrapper:
         """
         try:
             self.repo.git.checkout(ref)
+            self._invalidate_meta('current_branch')
             return True
         except GitCommandError:
             return False
@@ -311,7 +365,10 @@ class GitWrapper:
         Returns:
         - str: URL of the remote repository.
         """
-        return self.repo.remote(name=remote_name).url
+        key = ('remote_url', remote_name)
+        if key not in self._meta_cache:
+            self._meta_cache[key] = self.repo.remote(name=remote_name).url
+        return self._meta_cache[key]
 
     def rename_branch(self, old_name, new_name):
         """
@@ -326,6 +383,7 @@ class GitWrapper:
         """
         try:
             self.repo.git.branch('-m', old_name, new_name)
+            self._invalidate_meta('branches', 'current_branch')
             return True
         except GitCommandError:
             return False
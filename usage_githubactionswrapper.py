@@ -0,0 +1,29 @@
+
+from githubactionswrapper.githubactionswrapper import GitHubActionsWrapper
+
+github_owner = 'tanbir'
+github_repo = 'miniDOF'
+github_token = 'ghp_your_token_here'
+
+actions_wrapper = GitHubActionsWrapper(github_owner, github_repo, github_token)
+
+# Get all workflows
+print("Workflows:", actions_wrapper.get_workflows())
+
+# Get the ID of a workflow by path
+workflow_id = actions_wrapper.get_workflow_id('.github/workflows/ci.yml')
+print("Workflow ID:", workflow_id)
+
+# Get the runs of the workflow
+runs = actions_wrapper.get_workflow_runs(workflow_id)
+print("Workflow Runs:", runs)
+
+# Get the logs of every job of the latest run, fetched concurrently
+if runs:
+    run_id = runs[0]['id']
+    print("Job Logs:", actions_wrapper.get_logs_for_run_jobs(run_id))
+
+    # Download the first artifact of the run
+    artifacts = actions_wrapper.get_artifacts_for_run(run_id)
+    if artifacts:
+        actions_wrapper.download_artifact(artifacts[0]['id'], 'artifact.zip')
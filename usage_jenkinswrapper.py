@@ -1,51 +1,94 @@
 
-from jenkinswrapper.jenkinswrapper import JenkinsWrapper
-
-jenkins_server_url = 'http://localhost:8080'
-jenkins_username = 'admin'
-jenkins_password = 'admin123'
-
-jenkins_wrapper = JenkinsWrapper(jenkins_server_url, jenkins_username, jenkins_password)
-
-# Get the Jenkins server info
-print("Jenkins Server Info:", jenkins_wrapper.get_server_info())
-
-# Get the current user info
-print("Current User Info:", jenkins_wrapper.get_user_info())
-
-# Create a new job
-job_name = 'test-job'
-config_xml = jenkins.EMPTY_CONFIG_XML
-
-# Create the job
-print("Creating Job:", jenkins_wrapper.create_job(job_name, config_xml))
-
-# Get all jobs
-print("All Jobs:", jenkins_wrapper.get_all_jobs())
-
-# Get job info
-print("Job Info:", jenkins_wrapper.get_job_info(job_name))
-
-# Trigger a build
-print("Triggering Build:", jenkins_wrapper.trigger_build(job_name))
-
-# Get last build info
-last_build_info = jenkins_wrapper.get_last_build_info(job_name)
-print("Last Build Info:", last_build_info)
-
-# Get all nodes
-print("All Nodes:", jenkins_wrapper.get_all_nodes())
-
-# Get all views
-print("All Views:", jenkins_wrapper.get_views())
-
-# Get all plugins info
-print("All Plugins Info:", jenkins_wrapper.get_plugins_info())
-
-# Get computer info
-print("Computer Info:", jenkins_wrapper.get_computer_info())
-
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
 
+import jenkins
 
+from jenkinswrapper.jenkinswrapper import JenkinsWrapper
 
+def emit(label, payload):
+    """Write one labelled result as a JSON line straight to the stdout buffer.
+
+    orjson serializes at C speed and the binary write skips repr() and
+    per-line text encoding, so printing megabyte-sized payloads (the plugin
+    listing, for example) no longer dominates the script's wall time.
+    """
+    sys.stdout.buffer.write(
+        orjson.dumps({label: payload}, option=orjson.OPT_APPEND_NEWLINE)
+    )
+
+def run_dag(nodes, max_workers=16):
+    """Run a dict of name -> (func, deps) nodes, starting each node as soon
+    as all of its dependencies have finished.
+
+    Each func receives the dict of completed results so chained nodes can
+    read their dependencies' outputs. Independent nodes overlap freely, so
+    wall time collapses to the longest dependency chain instead of the sum
+    of all calls.
+    """
+    results = {}
+    pending = dict(nodes)
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or in_flight:
+            ready = [
+                name for name, (_, deps) in pending.items()
+                if all(dep in results for dep in deps)
+            ]
+            for name in ready:
+                func, _ = pending.pop(name)
+                in_flight[executor.submit(func, results)] = name
+            future = next(as_completed(in_flight))
+            results[in_flight.pop(future)] = future.result()
+    return results
+
+def main():
+    """Exercise the wrapper end to end; no network calls happen at import."""
+    jenkins_server_url = 'http://localhost:8080'
+    jenkins_username = 'admin'
+    jenkins_password = 'admin123'
+
+    jenkins_wrapper = JenkinsWrapper.get_default(jenkins_server_url, jenkins_username, jenkins_password)
+
+    job_name = 'test-job'
+    config_xml = jenkins.EMPTY_CONFIG_XML
+    # The handle formats the /job/<name> URL fragment once for the whole chain.
+    job = jenkins_wrapper.job(job_name)
+
+    # Only the create -> trigger -> wait -> job-info chain is ordered; every
+    # other call runs as soon as a worker is free.
+    nodes = {
+        'server_info': (lambda results: jenkins_wrapper.get_server_info(), []),
+        'user_info': (lambda results: jenkins_wrapper.get_user_info(), []),
+        'all_jobs': (lambda results: jenkins_wrapper.get_all_jobs(), []),
+        'views': (lambda results: jenkins_wrapper.get_views(), []),
+        'plugins': (lambda results: jenkins_wrapper.get_plugins_info(), []),
+        'computers': (lambda results: jenkins_wrapper.get_computers(), []),
+        'create_job': (lambda results: job.create(config_xml), []),
+        'queue_id': (lambda results: job.build(), ['create_job']),
+        'started_build': (lambda results: jenkins_wrapper.wait_for_build(results['queue_id']), ['queue_id']),
+        'job_info': (lambda results: job.info(), ['started_build']),
+    }
+    results = run_dag(nodes)
+
+    emit("Jenkins Server Info", results['server_info'])
+    emit("Current User Info", results['user_info'])
+    emit("All Jobs", results['all_jobs'])
+    emit("Triggering Build", results['queue_id'])
+    emit("Started Build", results['started_build'])
+    # One tree-filtered request answers both the job info and the last build.
+    emit("Job Info", results['job_info'])
+    emit("Last Build Info", results['job_info']['lastBuild'])
+    emit("All Views", results['views'])
+    emit("All Plugins Info", results['plugins'])
+    # One fused request covers the node list and the executor summary.
+    emit("All Nodes", results['computers']['computer'])
+    emit("Executor Summary", {
+        'busy': results['computers']['busyExecutors'],
+        'total': results['computers']['totalExecutors'],
+    })
+
+if __name__ == "__main__":
+    main()